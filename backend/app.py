@@ -1,10 +1,11 @@
+import math
+
 from flask import Flask
 from flask_cors import CORS
-import polars as pl
-import pickle
 
-with open('chrome.pkl', 'rb') as f:
-    chrome = pickle.load(f)
+from chrome_store import CHROME_STORE, STAT_COLUMNS, ChromeStore
+
+chrome = ChromeStore.load(CHROME_STORE)
 
 app = Flask(__name__)
 CORS(app)
@@ -12,74 +13,33 @@ CORS(app)
 
 @app.route('/<dayOfWeek>/<monthOfYear>/<origin>/<waypoint>/<airline>/<depHour>/<layover>')
 def main(dayOfWeek, monthOfYear, origin, waypoint, airline, depHour, layover):
-    cols = [
-        'pGreaterThan60',
-        'pLessThan15',
-        'delayMean',
-        'delay90th',
-        'pCancel',
-        'delayStd',
-        'n',
-        'shape',
-        'scale'
-    ]
-    res5 = chrome[5].filter(
-        pl.col('DayOfWeek') == int(dayOfWeek)
-    ).filter(
-        pl.col('Month') == int(monthOfYear)
-    ).filter(
-        pl.col('Origin') == origin
-    ).filter(
-        pl.col('Airline') == airline
-    ).filter(
-        pl.col('Hour') == int(depHour)
+    # Falls back from chrome5 to chrome4 to chrome3 until a group matches
+    match = chrome.lookup(
+        airline=airline,
+        hour=int(depHour),
+        month=int(monthOfYear),
+        origin=origin,
+        day_of_week=int(dayOfWeek),
     )
+    if match is None:
+        return "No matches :("
+    level, stats = match
+    detail = str(level)
+    row = dict(zip(STAT_COLUMNS, stats.tolist()))
 
-    if res5[0,0] is None:
-        res4 = chrome[4].filter(
-            pl.col('Month') == int(monthOfYear)
-        ).filter(
-            pl.col('Origin') == origin
-        ).filter(
-            pl.col('Airline') == airline
-        ).filter(
-            pl.col('Hour') == int(depHour)
-        )
-        if res4[0,0] is None:
-            res3 = chrome[3].filter(
-                pl.col('Month') == int(monthOfYear)
-            ).filter(
-                pl.col('Airline') == airline
-            ).filter(
-                pl.col('Hour') == int(depHour)
-            )
-            if res3[0,0] is None:
-                return "No matches :("
-            else:
-                res = res3
-                detail = "3"
-        else:
-            res = res4
-            detail = "4"
-    else:
-        res = res5
-        detail = "5"
-
-    row = res.select(cols).mean()
-
-    if row['pLessThan15'][0] is None:
+    if math.isnan(row['pLessThan15']):
         return 'Not enough data for this flight'
-    onTime = round(100*row['pLessThan15'][0])  # % of flights with less than 15 minute delay
-    tooLate = round(100*row['pGreaterThan60'][0])  # % of flights with greater than 60 minute delay
-    delayMean = round(row['delayMean'][0])
-    delayStd = round(row['delayStd'][0])
+    onTime = round(100*row['pLessThan15'])  # % of flights with less than 15 minute delay
+    tooLate = round(100*row['pGreaterThan60'])  # % of flights with greater than 60 minute delay
+    delayMean = round(row['delayMean'])
+    delayStd = round(row['delayStd'])
 
-    shape = row['shape'][0]
-    scale = row['scale'][0]
+    shape = row['shape']
+    scale = row['scale']
     print(f'DEBUG: shape is {shape} and scale is {scale}!!!')
 
-    if row['n'][0] > 100:
-        pCancel = round(100*row['pCancel'][0], 1)
+    if row['n'] > 100:
+        pCancel = round(100*row['pCancel'], 1)
     else:
         pCancel = None
 
@@ -0,0 +1,146 @@
+"""Compact serve-time storage for the chrome delay aggregates.
+
+`concat_data.py` dictionary-encodes airlines and airports to small integers and
+packs every chrome level into a sorted array of composite integer keys plus a
+contiguous float32 matrix of the stats the API needs. `app.py` loads the result
+once and answers each request with a binary search and a single row read.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+GROUP_COLUMNS: List[str] = ["Airline", "Hour", "Month", "Origin", "DayOfWeek"]
+CHROME_LEVELS = (5, 4, 3)
+STAT_COLUMNS: Tuple[str, ...] = (
+    "pLessThan15",
+    "pGreaterThan60",
+    "delayMean",
+    "delayStd",
+    "pCancel",
+    "n",
+    "shape",
+    "scale",
+)
+# Exclusive upper bounds for the integer-valued group columns (CRSDepTime 2400 gives hour 24).
+INTEGER_RADIX = {"Hour": 25, "Month": 13, "DayOfWeek": 8}
+CHROME_STORE = "chrome_store.npz"
+
+
+def compose_keys(values: Sequence, radices: Sequence[int]) -> int | np.ndarray:
+    """Fold per-column codes into one mixed-radix key (works on ints or arrays)."""
+
+    key = 0
+    for value, radix in zip(values, radices):
+        key = key * radix + value
+    return key
+
+
+class ChromeStore:
+    """Integer-keyed lookup table over the chrome levels."""
+
+    def __init__(
+        self,
+        airlines: np.ndarray,
+        airports: np.ndarray,
+        levels: Mapping[int, Tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        self.airlines = airlines
+        self.airports = airports
+        self.levels = dict(levels)
+        self.airline_codes = {str(code): idx for idx, code in enumerate(airlines)}
+        self.airport_codes = {str(code): idx for idx, code in enumerate(airports)}
+
+    def radices(self, level: int) -> List[int]:
+        """Return the key radix of each group column used at *level*."""
+
+        sizes = {
+            "Airline": len(self.airlines),
+            "Origin": len(self.airports),
+            **INTEGER_RADIX,
+        }
+        return [sizes[name] for name in GROUP_COLUMNS[:level]]
+
+    def encode(
+        self,
+        level: int,
+        airline: str,
+        hour: int,
+        month: int,
+        origin: str,
+        day_of_week: int,
+    ) -> int | None:
+        """Build the composite key for *level*, or ``None`` if a value is unknown."""
+
+        codes = {
+            "Airline": self.airline_codes.get(airline),
+            "Hour": hour,
+            "Month": month,
+            "Origin": self.airport_codes.get(origin),
+            "DayOfWeek": day_of_week,
+        }
+        values = [codes[name] for name in GROUP_COLUMNS[:level]]
+        radices = self.radices(level)
+        for value, radix in zip(values, radices):
+            if value is None or not 0 <= value < radix:
+                return None
+        return compose_keys(values, radices)
+
+    def lookup(
+        self,
+        airline: str,
+        hour: int,
+        month: int,
+        origin: str,
+        day_of_week: int,
+    ) -> Tuple[int, np.ndarray] | None:
+        """Return ``(level, stats_row)`` for the most detailed level with a match."""
+
+        for level in CHROME_LEVELS:
+            if level not in self.levels:
+                continue
+            key = self.encode(level, airline, hour, month, origin, day_of_week)
+            if key is None:
+                continue
+            keys, stats = self.levels[level]
+            idx = int(np.searchsorted(keys, key))
+            if idx < len(keys) and keys[idx] == key:
+                return level, stats[idx]
+        return None
+
+    def nbytes(self) -> int:
+        """Return the number of bytes held by the key, stats and vocabulary arrays."""
+
+        arrays = [self.airlines, self.airports]
+        for keys, stats in self.levels.values():
+            arrays.extend((keys, stats))
+        return sum(array.nbytes for array in arrays)
+
+    def save(self, path: str | Path) -> None:
+        """Write the store as an uncompressed ``.npz`` archive."""
+
+        arrays: Dict[str, np.ndarray] = {
+            "airlines": self.airlines,
+            "airports": self.airports,
+        }
+        for level, (keys, stats) in self.levels.items():
+            arrays[f"keys{level}"] = keys
+            arrays[f"stats{level}"] = stats
+        with Path(path).open("wb") as handle:
+            np.savez(handle, **arrays)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ChromeStore":
+        """Read a store previously written by :meth:`save`."""
+
+        with np.load(path, allow_pickle=False) as archive:
+            levels = {
+                level: (archive[f"keys{level}"], archive[f"stats{level}"])
+                for level in CHROME_LEVELS
+                if f"keys{level}" in archive.files
+            }
+            return cls(archive["airlines"], archive["airports"], levels)
@@ -4,10 +4,14 @@
 This script ingests BTS on-time performance CSV extracts, normalises the schema,
 materialises a consolidated parquet (`data_big.parquet`), and prepares the
 `chrome*.parquet` files used downstream. A pickled dictionary containing all
-three chrome datasets is also emitted as `chrome.pkl`.
+three chrome datasets is also emitted as `chrome.pkl`, alongside the compact
+integer-keyed `chrome_store.npz` that the API serves from.
 
 Example:
     python concat_data.py --data-dir data --output-dir . --n-cores 12
+
+To rebuild only `chrome_store.npz` from an existing `chrome.pkl`:
+    python concat_data.py --output-dir . --store-only
 """
 
 from __future__ import annotations
@@ -26,6 +30,16 @@ from scipy.optimize import minimize
 from scipy.stats import weibull_min
 from tqdm.auto import tqdm
 
+from chrome_store import (
+    CHROME_LEVELS,
+    CHROME_STORE,
+    GROUP_COLUMNS,
+    INTEGER_RADIX,
+    STAT_COLUMNS,
+    ChromeStore,
+    compose_keys,
+)
+
 
 FINAL_COLUMNS: List[str] = [
     "Flying_Airline",
@@ -74,9 +88,7 @@ TYPE_MAP = {
 }
 
 STRING_NULL_COLUMNS = ["CancellationCode", "Div1Airport"]
-GROUP_COLUMNS = ["Airline", "Hour", "Month", "Origin", "DayOfWeek"]
 DEFAULT_PARQUET = "data_big.parquet"
-CHROME_LEVELS = (5, 4, 3)
 CHROME_PICKLE = "chrome.pkl"
 WEIBULL_BOUNDS = ((0.5, 8.0), (1.0, 100.0))
 DEFAULT_WEIBULL_RESULT = (2.0, 10.0)
@@ -117,6 +129,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Overwrite existing parquet outputs instead of reusing them if present.",
     )
+    parser.add_argument(
+        "--store-only",
+        action="store_true",
+        help="Rebuild chrome_store.npz from the existing chrome.pkl in --output-dir and exit.",
+    )
     return parser.parse_args()
 
 
@@ -407,6 +424,62 @@ def build_chrome_datasets(
     return chrome
 
 
+def build_chrome_store(chrome: dict[int, pl.DataFrame]) -> ChromeStore:
+    """Dictionary-encode the chrome datasets into a sorted, float32 lookup table."""
+
+    populated = {level: dataset for level, dataset in chrome.items() if not dataset.is_empty()}
+    vocab = {
+        name: sorted(
+            {
+                code
+                for dataset in populated.values()
+                if name in dataset.columns
+                for code in dataset[name].drop_nulls()
+            }
+        )
+        for name in ("Airline", "Origin")
+    }
+    store = ChromeStore(
+        np.array(vocab["Airline"], dtype=str),
+        np.array(vocab["Origin"], dtype=str),
+        {},
+    )
+
+    for level, dataset in populated.items():
+        group_cols = GROUP_COLUMNS[:level]
+        valid = dataset.drop_nulls(group_cols).filter(
+            [
+                col(name).is_between(0, INTEGER_RADIX[name], closed="left")
+                for name in group_cols
+                if name in INTEGER_RADIX
+            ]
+        )
+        codes = []
+        for name in group_cols:
+            values = valid[name]
+            if name in vocab:
+                values = values.replace_strict(
+                    {code: idx for idx, code in enumerate(vocab[name])}
+                )
+            codes.append(values.cast(pl.Int64).to_numpy())
+
+        radices = store.radices(level)
+        assert np.prod(radices, dtype=np.float64) < np.iinfo(np.int64).max, (
+            f"chrome{level} key space {radices} overflows int64"
+        )
+        keys = np.asarray(compose_keys(codes, radices), dtype=np.int64)
+        stats = valid.select([col(name).cast(pl.Float32) for name in STAT_COLUMNS]).to_numpy()
+
+        order = np.argsort(keys, kind="stable")
+        store.levels[level] = (
+            keys[order],
+            np.ascontiguousarray(stats[order], dtype=np.float32),
+        )
+        print(f"Encoded chrome{level} into {len(keys):,} integer-keyed rows")
+
+    return store
+
+
 def write_outputs(
     df: pl.DataFrame,
     chrome: dict[int, pl.DataFrame],
@@ -437,10 +510,36 @@ def write_outputs(
         pickle.dump(chrome, handle, protocol=pickle.HIGHEST_PROTOCOL)
     print(f"Serialised all chrome datasets to {pickle_path}")
 
+    store_path = output_dir / CHROME_STORE
+    build_chrome_store(chrome).save(store_path)
+    print(f"Wrote integer-keyed chrome store to {store_path}")
+
+
+def rebuild_chrome_store(output_dir: Path) -> None:
+    """Re-encode an existing `chrome.pkl` into `chrome_store.npz` without refitting."""
+
+    pickle_path = output_dir / CHROME_PICKLE
+    with pickle_path.open("rb") as handle:
+        chrome = pickle.load(handle)
+
+    store = build_chrome_store(chrome)
+    store_path = output_dir / CHROME_STORE
+    store.save(store_path)
+
+    frames_bytes = sum(dataset.estimated_size() for dataset in chrome.values())
+    print(
+        f"Wrote integer-keyed chrome store to {store_path} "
+        f"({store.nbytes():,} bytes in memory vs {frames_bytes:,} for the Polars frames)"
+    )
+
 
 def main() -> None:
     args = parse_args()
 
+    if args.store_only:
+        rebuild_chrome_store(args.output_dir)
+        return
+
     print("Step 1/4: Loading raw CSV extracts…")
     base_df = load_flight_data(args.data_dir)
 
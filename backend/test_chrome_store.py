@@ -0,0 +1,169 @@
+"""Check the integer-keyed chrome store against the original Polars filters."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import polars as pl
+import pytest
+
+from chrome_store import STAT_COLUMNS, ChromeStore
+from concat_data import build_chrome_store
+
+
+AIRLINES = ["AA", "DL", "UA", "WN"]
+AIRPORTS = ["ATL", "DEN", "LAX", "ORD", "RDU"]
+
+
+def _stats(rng: random.Random, height: int) -> dict[str, list]:
+    return {
+        "pLessThan15": [rng.random() for _ in range(height)],
+        "pGreaterThan60": [rng.random() for _ in range(height)],
+        "delayMean": [rng.uniform(0, 30) for _ in range(height)],
+        "delay90th": [rng.uniform(0, 90) for _ in range(height)],
+        "pCancel": [rng.random() / 10 for _ in range(height)],
+        "n": [rng.randint(30, 500) for _ in range(height)],
+        "delayStd": [rng.uniform(0, 30) for _ in range(height)],
+        "shape": [rng.uniform(0.5, 8.0) for _ in range(height)],
+        "scale": [rng.uniform(1.0, 100.0) for _ in range(height)],
+    }
+
+
+def _level(rng: random.Random, columns: list[str], height: int) -> pl.DataFrame:
+    domains = {
+        "Airline": AIRLINES,
+        "Hour": list(range(25)),
+        "Month": list(range(1, 13)),
+        "Origin": AIRPORTS,
+        "DayOfWeek": list(range(1, 8)),
+    }
+    groups = {tuple(rng.choice(domains[name]) for name in columns) for _ in range(height)}
+    keys = {name: [group[idx] for group in groups] for idx, name in enumerate(columns)}
+    return pl.DataFrame({**keys, **_stats(rng, len(groups))})
+
+
+@pytest.fixture
+def chrome() -> dict[int, pl.DataFrame]:
+    rng = random.Random(26)
+    return {
+        5: _level(rng, ["Airline", "Hour", "Month", "Origin", "DayOfWeek"], 400),
+        4: _level(rng, ["Airline", "Hour", "Month", "Origin"], 200),
+        3: _level(rng, ["Airline", "Hour", "Month"], 150),
+    }
+
+
+@pytest.fixture
+def store(chrome, tmp_path) -> ChromeStore:
+    path = tmp_path / "chrome_store.npz"
+    build_chrome_store(chrome).save(path)
+    return ChromeStore.load(str(path))
+
+
+def polars_lookup(chrome, airline, hour, month, origin, day_of_week):
+    """The chained filters `app.main` used before the store existed."""
+
+    filters = {
+        5: dict(DayOfWeek=day_of_week, Month=month, Origin=origin, Airline=airline, Hour=hour),
+        4: dict(Month=month, Origin=origin, Airline=airline, Hour=hour),
+        3: dict(Month=month, Airline=airline, Hour=hour),
+    }
+    for level in (5, 4, 3):
+        res = chrome[level]
+        if res.is_empty():
+            continue
+        for name, value in filters[level].items():
+            res = res.filter(pl.col(name) == value)
+        if res.height:
+            return level, np.array([res[name][0] for name in STAT_COLUMNS], dtype=np.float32)
+    return None
+
+
+def assert_same(store, chrome, *query):
+    expected = polars_lookup(chrome, *query)
+    actual = store.lookup(*query)
+    if expected is None:
+        assert actual is None, query
+        return
+    assert actual is not None, query
+    assert actual[0] == expected[0], query
+    np.testing.assert_array_equal(actual[1], expected[1])
+
+
+def test_hit_at_each_level(store, chrome):
+    for level in (5, 4, 3):
+        row = chrome[level].row(0, named=True)
+        query = (
+            row["Airline"],
+            row["Hour"],
+            row["Month"],
+            row.get("Origin", "XXX"),
+            row.get("DayOfWeek", 0),
+        )
+        if level == 4:
+            # Pick a weekday no chrome5 group shares so the lookup falls through.
+            query = query[:4] + (0,)
+        assert store.lookup(*query)[0] == level
+        assert_same(store, chrome, *query)
+
+
+def test_matches_polars_filters(store, chrome):
+    rng = random.Random(0)
+    airlines = AIRLINES + ["ZZ"]
+    airports = AIRPORTS + ["XXX"]
+    for _ in range(2000):
+        query = (
+            rng.choice(airlines),
+            rng.randint(-1, 26),
+            rng.randint(-1, 14),
+            rng.choice(airports),
+            rng.randint(-1, 9),
+        )
+        assert_same(store, chrome, *query)
+
+
+@pytest.mark.parametrize(
+    "hour, month, day_of_week",
+    [(25, 1, 1), (-1, 1, 1), (8, 0, 1), (8, 13, 1), (8, 1, 0), (8, 1, 8)],
+)
+def test_out_of_range_ints_miss(store, hour, month, day_of_week):
+    for airline in AIRLINES:
+        for origin in AIRPORTS:
+            match = store.lookup(airline, hour, month, origin, day_of_week)
+            assert match is None or match[0] != 5
+
+
+def test_unknown_codes_miss(store):
+    assert store.lookup("ZZ", 8, 1, "ATL", 1) is None
+
+
+def test_empty_level_is_skipped(chrome, tmp_path):
+    # Mirrors build_chrome_datasets, which keeps the bare summary when no group qualifies.
+    chrome[4] = chrome[4].clear().drop("shape", "scale")
+    path = tmp_path / "chrome_store.npz"
+    build_chrome_store(chrome).save(path)
+    store = ChromeStore.load(path)
+
+    assert 4 not in store.levels
+    row = chrome[3].row(0, named=True)
+    assert_same(store, chrome, row["Airline"], row["Hour"], row["Month"], "XXX", 0)
+
+
+def test_null_stat_becomes_nan(chrome, tmp_path):
+    chrome[5] = chrome[5].with_columns(
+        pl.when(pl.int_range(pl.len()) == 0)
+        .then(None)
+        .otherwise(pl.col("pLessThan15"))
+        .alias("pLessThan15")
+    )
+    path = tmp_path / "chrome_store.npz"
+    build_chrome_store(chrome).save(path)
+    store = ChromeStore.load(path)
+
+    row = chrome[5].row(0, named=True)
+    level, stats = store.lookup(
+        row["Airline"], row["Hour"], row["Month"], row["Origin"], row["DayOfWeek"]
+    )
+    assert level == 5
+    assert math.isnan(dict(zip(STAT_COLUMNS, stats.tolist()))["pLessThan15"])